@@ -1,15 +1,36 @@
 # --- Imports ---
 import os
+import gzip
+import math
+import time
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dotenv import load_dotenv
 from flask import Flask, jsonify, Response, request
 from flask_cors import CORS
 import pandas as pd
 import logging
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 import sys
 from yfinance.exceptions import YFDataException
 import numpy as np # Import numpy for checking numeric types
+import orjson
+
+try:
+    import ormsgpack
+except ImportError: # msgpack transport is optional; JSON stays the default
+    ormsgpack = None
+
+try:
+    import pyarrow as pa
+except ImportError: # pyarrow is optional; the NumPy cleanup path still applies
+    pa = None
 
 # --- Load Environment Variables ---
 load_dotenv()
@@ -36,117 +57,350 @@ FRONTEND_ORIGIN = f"http://localhost:{FRONTEND_PORT}"
 CORS(app, resources={r"/api/*": {"origins": FRONTEND_ORIGIN}})
 logging.info(f"CORS enabled for origin: {FRONTEND_ORIGIN}")
 
+# --- Shared HTTP Session ---
+# One keep-alive session for all yfinance traffic, so the TCP/TLS handshake to
+# Yahoo is paid once per pooled connection instead of once per fetch
+SESSION = requests.Session()
+SESSION.headers.update({'User-Agent': 'Mozilla/5.0'})
+_http_adapter = HTTPAdapter(
+    pool_connections=32,
+    pool_maxsize=32,
+    max_retries=Retry(total=2, backoff_factor=0.2),
+)
+SESSION.mount('https://', _http_adapter)
+SESSION.mount('http://', _http_adapter)
+
+# --- In-Memory Caching ---
+# Repeated requests for the same ticker within the TTL window are served from
+# this cache instead of re-hitting yfinance (two HTTPS round-trips per miss).
+CACHE_TTL_SECONDS = 60
+# Negative entries (ticker yielded no data) live longer: invalid symbols do
+# not become valid quickly, and re-probing them costs full network round-trips
+NEGATIVE_CACHE_TTL_SECONDS = 300
+CACHE_MAX_ENTRIES = 256
+
+# Sentinel cached in place of a payload for tickers that yielded no data
+_NOT_FOUND = object()
+
+_STOCK_CACHE = OrderedDict()  # ticker -> (monotonic timestamp, payload dict)
+_STOCK_CACHE_LOCK = threading.Lock()
+
+# ticker -> yf.Ticker, avoids re-instantiation per request; bounded like the
+# payload cache so arbitrary invalid symbols cannot grow it without limit
+_TICKER_OBJECTS = OrderedDict()
+_TICKER_OBJECTS_LOCK = threading.Lock()
+
+# Pool for overlapping the independent yfinance round-trips (info + history)
+_FETCH_POOL = ThreadPoolExecutor(max_workers=4)
+FETCH_TIMEOUT_SECONDS = 15
+
+def _get_ticker(ticker_symbol):
+    """ Returns a memoized yf.Ticker object for the given symbol. """
+    with _TICKER_OBJECTS_LOCK:
+        ticker = _TICKER_OBJECTS.get(ticker_symbol)
+        if ticker is None:
+            ticker = yf.Ticker(ticker_symbol, session=SESSION)
+            _TICKER_OBJECTS[ticker_symbol] = ticker
+        _TICKER_OBJECTS.move_to_end(ticker_symbol)
+        while len(_TICKER_OBJECTS) > CACHE_MAX_ENTRIES:
+            _TICKER_OBJECTS.popitem(last=False)
+        return ticker
+
+def _cache_get(key):
+    """ Returns a cached payload for the key if still fresh, else None. """
+    with _STOCK_CACHE_LOCK:
+        entry = _STOCK_CACHE.get(key)
+        if entry is None:
+            return None
+        timestamp, payload = entry
+        ttl = NEGATIVE_CACHE_TTL_SECONDS if payload is _NOT_FOUND else CACHE_TTL_SECONDS
+        if time.monotonic() - timestamp >= ttl:
+            # Stale entry; drop it so a fresh fetch replaces it
+            del _STOCK_CACHE[key]
+            return None
+        # Mark as recently used so eviction targets cold entries first
+        _STOCK_CACHE.move_to_end(key)
+        return payload
+
+def _cache_put(key, payload):
+    """ Stores a payload for the key, evicting the oldest entries if full. """
+    with _STOCK_CACHE_LOCK:
+        _STOCK_CACHE[key] = (time.monotonic(), payload)
+        _STOCK_CACHE.move_to_end(key)
+        while len(_STOCK_CACHE) > CACHE_MAX_ENTRIES:
+            _STOCK_CACHE.popitem(last=False)
+
 # --- Helper Functions ---
+try:
+    from numba import njit
+except ImportError: # numba is optional; fall back to the NumPy ufunc path
+    njit = None
+
+if njit is not None:
+    @njit(cache=True)
+    def _nonfinite_mask(arr):
+        """ Returns a bool mask marking NaN/Inf entries of a float array. """
+        mask = np.empty(arr.size, np.bool_)
+        for i in range(arr.size):
+            v = arr[i]
+            mask[i] = not (v == v and v != np.inf and v != -np.inf)
+        return mask
+
+    # Warm the JIT at import time so the first request does not pay compilation
+    _nonfinite_mask(np.zeros(1))
+else:
+    def _nonfinite_mask(arr):
+        """ Returns a bool mask marking NaN/Inf entries of a float array. """
+        return ~np.isfinite(arr)
+
+def _float_or_none(value):
+    """ Converts a float-like scalar, mapping NaN/Inf to None. """
+    return float(value) if math.isfinite(value) else None
+
+def _int_or_none(value):
+    """ Converts a numpy integer scalar, mapping overflow to None. """
+    try:
+        return int(value)
+    except OverflowError:
+        logging.warning(f"Large numpy integer detected (overflow): {value}, converting to None.")
+        return None
+
+def _datetime_to_iso(value):
+    """ Formats a datetime/Timestamp as ISO 8601 with 'Z' for UTC. """
+    try:
+        # Convert timezone-aware to naive UTC before formatting
+        offset = value.utcoffset()
+        if offset is not None:
+            # Create offset-naive UTC datetime
+            value_utc_naive = value.replace(tzinfo=None) - offset
+        else:
+            # Assume naive datetime is already UTC (or handle as local if needed)
+            value_utc_naive = value
+        return value_utc_naive.strftime('%Y-%m-%dT%H:%M:%SZ')
+    except Exception as dt_err:
+        logging.warning(f"Could not convert datetime object {value} to string: {dt_err}")
+        return None # Fallback if conversion fails
+
+def _convert_sequence(value):
+    """ Recursively converts each item of a list/tuple. """
+    return [safe_convert(item) for item in value]
+
+def _convert_array(value):
+    """ Converts a NumPy array / Pandas Series to a cleaned Python list. """
+    arr = value.to_numpy() if isinstance(value, pd.Series) else value
+    if arr.ndim == 1 and arr.dtype.kind == 'f':
+        # Homogeneous float data: tolist() already yields Python floats, so a
+        # single vectorized finiteness mask replaces per-element recursion
+        mask = _nonfinite_mask(arr)
+        if not mask.any():
+            return arr.tolist()
+        return [None if m else v for v, m in zip(arr.tolist(), mask.tolist())]
+    if arr.ndim == 1 and arr.dtype.kind in 'iu':
+        # Integer data cannot hold NaN; tolist() yields plain Python ints
+        return arr.tolist()
+    # Object or multi-dimensional data: recurse element-wise as before
+    return [safe_convert(item) for item in arr.tolist()]
+
+# type -> handler table so safe_convert dispatches in O(1) instead of probing
+# a long isinstance chain per value. Exact type() match is safe here because
+# numpy scalar types are leaf classes.
+_CONVERTERS = {
+    list: _convert_sequence,
+    tuple: _convert_sequence,
+    np.ndarray: _convert_array,
+    pd.Series: _convert_array,
+    np.int64: _int_or_none,
+    np.int32: _int_or_none,
+    np.int16: _int_or_none,
+    np.int8: _int_or_none,
+    np.float64: _float_or_none,
+    np.float32: _float_or_none,
+    np.float16: _float_or_none,
+    np.bool_: bool,
+    datetime: _datetime_to_iso,
+    pd.Timestamp: _datetime_to_iso,
+}
+
 def safe_convert(value):
     """
     Safely converts values to JSON serializable types.
     Handles lists, tuples, pd.NA, np.nan, large numbers, numpy types, and array-like structures.
     """
-    # --- >>> START OF REVISED FIX (v4) <<< ---
-    # 1. Handle Python list/tuple types first
-    if isinstance(value, (list, tuple)):
-        # Recursively apply safe_convert to each item in the list/tuple
-        return [safe_convert(item) for item in value]
-    # 2. Handle NumPy arrays / Pandas Series next
-    elif isinstance(value, (np.ndarray, pd.Series)):
-        # Convert array/series to list and apply safe_convert recursively
-        return [safe_convert(item) for item in value.tolist()]
-    # --- >>> END OF REVISED FIX (v4) <<< ---
-
-    # 3. Handle specific Pandas/Numpy scalars AFTER handling list-like types
-    elif pd.isna(value) or value is pd.NA: # Should now be safe
+    handler = _CONVERTERS.get(type(value))
+    if handler is not None:
+        return handler(value)
+
+    # Fallbacks for types not in the dispatch table
+    if pd.isna(value) or value is pd.NA:
         return None
-    elif isinstance(value, (np.int64, np.int32, np.int16, np.int8)):
-        # Ensure large numpy ints are handled if they exceed Python's limits for JSON (though less common)
-        try:
-            return int(value)
-        except OverflowError:
-            logging.warning(f"Large numpy integer detected (overflow): {value}, converting to None.")
-            return None
-    elif isinstance(value, (np.float64, np.float32, np.float16)):
-        if np.isinf(value) or np.isnan(value): # Check for Inf/NaN floats
-             return None
-        return float(value)
-    elif isinstance(value, (np.bool_)):
-        return bool(value)
-
-    # 4. Handle potentially large standard Python numbers
-    elif isinstance(value, int) and abs(value) > 1e18: # Arbitrary threshold
-         logging.warning(f"Large integer detected: {value}, converting to None.")
-         return None
-
-    # 5. Handle datetime objects (convert to ISO string)
-    elif isinstance(value, (datetime, pd.Timestamp)):
-         try:
-             # Convert timezone-aware to naive UTC before formatting
-             offset = value.utcoffset()
-             if offset is not None:
-                 # Create offset-naive UTC datetime
-                 value_utc_naive = value.replace(tzinfo=None) - offset
-             else:
-                 # Assume naive datetime is already UTC (or handle as local if needed)
-                 value_utc_naive = value
-
-             # Format as ISO 8601 with 'Z' for UTC
-             return value_utc_naive.strftime('%Y-%m-%dT%H:%M:%SZ')
-         except Exception as dt_err:
-             logging.warning(f"Could not convert datetime object {value} to string: {dt_err}")
-             return None # Fallback if conversion fails
-
-    # 6. Return value as is if none of the above conditions match (e.g., str, bool, simple float/int)
+    if isinstance(value, int) and abs(value) > 1e18: # Arbitrary threshold
+        logging.warning(f"Large integer detected: {value}, converting to None.")
+        return None
+
+    # Return value as is if none of the above conditions match (e.g., str, bool, simple float/int)
     return value
 
-def get_stock_data(ticker_symbol):
+# Info keys the dashboard actually consumes. ticker.info returns ~150 keys
+# (company officers, long descriptions, ...), so trimming to this allowlist
+# before cleaning cuts both the safe_convert work and the payload size.
+# Clients can override per-request with ?fields=key1,key2.
+INFO_KEEP = frozenset({
+    'symbol', 'shortName', 'longName', 'regularMarketPrice', 'currentPrice',
+    'marketCap', 'sector', 'industry', 'trailingPE', 'dividendYield',
+    'fiftyTwoWeekHigh', 'fiftyTwoWeekLow', 'currency', 'exchange',
+    'previousClose', 'open', 'dayHigh', 'dayLow', 'volume', 'averageVolume',
+})
+
+@lru_cache(maxsize=128)
+def _fetch_cleaned_info(ticker_symbol, fields=None):
+    """
+    Fetches and sanitizes ticker.info for a symbol, cached per process.
+    Info is company metadata (sector, longName, marketCap, ...) that stays
+    stable for hours, so repeats skip both the HTTP call and the cleaning loop.
+    Only the INFO_KEEP allowlist (or the given frozenset of fields) is kept.
+    Fetch errors propagate so failures are not cached.
+    """
+    info = _get_ticker(ticker_symbol).info
+    # Basic check if info seems valid (e.g., contains a price)
+    if not info or (info.get('regularMarketPrice') is None and info.get('currentPrice') is None and info.get('symbol') is None):
+        logging.warning(f"Fetched info for '{ticker_symbol}' seems incomplete or lacks essential data. It might be invalid/delisted.")
+
+    keep = INFO_KEEP if fields is None else fields
+    cleaned_info = {}
+    if info:
+        logging.debug(f"Raw info keys for {ticker_symbol}: {list(info.keys())}")
+        for key in keep:
+            if key not in info:
+                continue
+            try:
+                # Apply safe conversion to each value
+                cleaned_info[key] = safe_convert(info[key])
+            except Exception as convert_err:
+                # Log error during conversion of a specific key
+                logging.error(f"Error converting info key '{key}' for {ticker_symbol}: {convert_err}", exc_info=True)
+                cleaned_info[key] = None # Set to None if conversion fails for a specific key
+    return cleaned_info
+
+def _clean_history_records(history_df):
+    """
+    Converts a fetched history DataFrame into JSON-ready records:
+    stringified dates, vectorized NaN/Inf -> None, and row dicts built by
+    zipping the cleaned columns.
+    """
+    history_df = history_df.reset_index()
+    if 'Date' in history_df.columns:
+        # Ensure Date is datetime before formatting
+        dates = pd.to_datetime(history_df['Date'], errors='coerce')
+        if dates.dt.tz is not None:
+            # Drop the tz but keep wall-clock time, matching the old
+            # strftime output
+            dates = dates.dt.tz_localize(None)
+        # Format via NumPy's C-level datetime64[s] printing instead of
+        # a Python-level strftime per row; NaT rows become None
+        date_arr = dates.to_numpy(dtype='datetime64[s]')
+        history_df['Date'] = np.where(
+            np.isnat(date_arr), None, np.char.add(date_arr.astype('U19'), 'Z'))
+    else:
+        logging.warning(" 'Date' column not found in historical data after reset_index.")
+
+    # Sanitize column-wise on the underlying ndarrays instead of running
+    # safe_convert over every cell of every record (O(rows x cols) Python calls)
+    cols = list(history_df.columns)
+    col_values = {}
+    if pa is not None:
+        # Zero-copy handoff to Arrow: from_pandas wraps the NumPy buffers and
+        # to_pylist() emits Python scalars (with None for NaN/NaT) from C++,
+        # skipping the per-column NumPy masking below
+        batch = pa.RecordBatch.from_pandas(history_df, preserve_index=False)
+        cols = list(batch.schema.names)
+        for i, col in enumerate(cols):
+            values = batch.column(i).to_pylist()
+            if pa.types.is_floating(batch.column(i).type):
+                # Arrow nulls NaN but passes +/-Inf through; mask Inf here so
+                # this branch matches the NumPy path's cleaned records
+                inf_mask = np.isinf(history_df[col].to_numpy())
+                if inf_mask.any():
+                    values = [None if m else v for v, m in zip(values, inf_mask.tolist())]
+            col_values[col] = values
+    else:
+        for col in cols:
+            arr = history_df[col].to_numpy()
+            if arr.dtype.kind == 'f':
+                # Vectorized NaN/Inf -> None in a single pass
+                col_values[col] = np.where(_nonfinite_mask(arr), None, arr).tolist()
+            elif arr.dtype.kind in 'iu':
+                # Integer columns cannot hold NaN; tolist() yields plain Python ints
+                col_values[col] = arr.tolist()
+            else:
+                # Object columns: the Date strings are already None-normalized
+                # at formatting time, so no per-cell conversion is needed
+                col_values[col] = arr.tolist()
+    # Zip the cleaned columns into row tuples rather than indexing each
+    # column per row; dict(zip(...)) is the fastest record constructor here
+    return [dict(zip(cols, row)) for row in zip(*(col_values[col] for col in cols))]
+
+# (day ordinal, start string, end string); see _date_range
+_DATE_RANGE_CACHE = (None, None, None)
+
+def _date_range():
+    """
+    Returns (start, end) date strings covering the trailing year, recomputed
+    only when the calendar day changes. Same-day fetches therefore share an
+    identical date range, which also keeps the payload cache key stable.
+    """
+    global _DATE_RANGE_CACHE
+    today = date.today().toordinal()
+    if _DATE_RANGE_CACHE[0] != today:
+        end_date = datetime.now()
+        start_date = end_date - timedelta(days=365) # Fetch one year
+        # Single tuple assignment, so concurrent readers see either the old
+        # or the new value but never a partial update
+        _DATE_RANGE_CACHE = (
+            today, start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d'))
+    return _DATE_RANGE_CACHE[1], _DATE_RANGE_CACHE[2]
+
+def get_stock_data(ticker_symbol, fields=None):
     """
     Fetches stock information and historical data for a given ticker symbol using yfinance.
-    Cleans the data for JSON serialization.
+    Cleans the data for JSON serialization. `fields`, if given, must be a
+    frozenset of info keys overriding the INFO_KEEP allowlist.
     """
+    cache_key = (ticker_symbol, fields)
+    cached = _cache_get(cache_key)
+    if cached is _NOT_FOUND:
+        # Known-bad ticker; 404 immediately without any network I/O
+        logging.info(f"Serving cached not-found result for ticker: {ticker_symbol}")
+        return None
+    if cached is not None:
+        logging.info(f"Serving cached data for ticker: {ticker_symbol}")
+        return cached
+
     logging.info(f"Attempting to fetch data for ticker: {ticker_symbol}")
     try:
-        ticker = yf.Ticker(ticker_symbol)
+        ticker = _get_ticker(ticker_symbol)
 
-        # --- Fetch Ticker Info ---
-        # Use download first for a quick check if the ticker likely exists and has recent data
-        quick_hist = ticker.history(period="5d", interval="1d")
-        info = {} # Initialize info dictionary
-
-        # Attempt to fetch info regardless, but log warnings if quick_hist failed
-        if quick_hist.empty:
-            logging.warning(f"No recent history found for ticker '{ticker_symbol}' via quick check. Attempting to fetch info directly.")
+        # Submit the two round-trips concurrently; info and the 1-year
+        # history are independent HTTPS calls, so overlapping them drops fetch
+        # time from the sum of their latencies to roughly the max
+        start_str, end_str = _date_range()
+        info_future = _FETCH_POOL.submit(_fetch_cleaned_info, ticker_symbol, fields)
+        history_future = _FETCH_POOL.submit(ticker.history, start=start_str, end=end_str)
 
+        cleaned_info = {}
         try:
-            info = ticker.info
-            # Basic check if info seems valid (e.g., contains a price)
-            if not info or (info.get('regularMarketPrice') is None and info.get('currentPrice') is None and info.get('symbol') is None):
-                logging.warning(f"Fetched info for '{ticker_symbol}' seems incomplete or lacks essential data. It might be invalid/delisted.")
-                # Decide if you want to proceed even with potentially bad info, or clear it
-                # info = {} # Option: Clear info if it seems invalid
+            # Copy so mutations of the response never touch the cached dict
+            cleaned_info = dict(info_future.result(timeout=FETCH_TIMEOUT_SECONDS))
         except Exception as info_err:
             logging.error(f"Failed to fetch .info for {ticker_symbol}: {info_err}. Proceeding without info.")
-            info = {} # Ensure info is an empty dict if fetch fails
 
-        # --- Clean Ticker Info ---
-        cleaned_info = {}
-        if info: # Process info only if it's not empty
-            logging.debug(f"Raw info keys for {ticker_symbol}: {list(info.keys())}") # Add debug log
-            for key, value in info.items():
-                try:
-                    # Apply safe conversion to each value
-                    cleaned_info[key] = safe_convert(value) # Uses the fixed safe_convert
-                except Exception as convert_err:
-                    # Log error during conversion of a specific key
-                    logging.error(f"Error converting info key '{key}' for {ticker_symbol}: {convert_err}", exc_info=True)
-                    cleaned_info[key] = None # Set to None if conversion fails for a specific key
-        else:
-             logging.warning(f"No 'info' data available or fetched for ticker {ticker_symbol}")
+        if not cleaned_info:
+            logging.warning(f"No 'info' data available or fetched for ticker {ticker_symbol}")
 
 
         # --- Fetch Historical Data ---
-        end_date = datetime.now()
-        start_date = end_date - timedelta(days=365) # Fetch one year
         history_df = pd.DataFrame() # Initialize empty DataFrame
         try:
-            history_df = ticker.history(start=start_date.strftime('%Y-%m-%d'), end=end_date.strftime('%Y-%m-%d'))
+            history_df = history_future.result(timeout=FETCH_TIMEOUT_SECONDS)
         except Exception as hist_err:
             logging.error(f"Failed to fetch history for {ticker_symbol}: {hist_err}")
             # Continue without history data
@@ -155,54 +409,69 @@ def get_stock_data(ticker_symbol):
         if history_df.empty:
             logging.warning(f"No historical data found for ticker '{ticker_symbol}' in the specified date range (or fetch failed).")
         else:
-            history_df.reset_index(inplace=True)
-            if 'Date' in history_df.columns:
-                 # Ensure Date is datetime before formatting
-                 history_df['Date'] = pd.to_datetime(history_df['Date'], errors='coerce')
-                 # Format valid dates, leave NaT as is (will become None later)
-                 history_df['Date_str'] = history_df['Date'].dt.strftime('%Y-%m-%dT%H:%M:%SZ')
-                 # Use the string version, keep original Date if needed elsewhere
-                 history_df['Date'] = history_df['Date_str']
-                 history_df.drop(columns=['Date_str'], inplace=True)
-            else:
-                 logging.warning(" 'Date' column not found in historical data after reset_index.")
-
-            # Replace pd.NA/np.nan/NaT with None before converting to dict
-            # Convert entire DataFrame to objects first to ensure replace works broadly
-            history_df = history_df.astype(object).replace({pd.NA: None, np.nan: None, pd.NaT: None})
-
-            history_list = history_df.to_dict('records')
-            # Apply safe_convert to history records as well for consistency
-            cleaned_history_list = []
-            for record in history_list:
-                cleaned_record = {}
-                for k, v in record.items():
-                    try:
-                        cleaned_record[k] = safe_convert(v)
-                    except Exception as convert_hist_err:
-                        logging.error(f"Error converting history key '{k}' for {ticker_symbol}: {convert_hist_err}")
-                        cleaned_record[k] = None # Fallback for history conversion error
-                cleaned_history_list.append(cleaned_record)
-            history_list = cleaned_history_list
+            history_list = _clean_history_records(history_df)
 
 
         # --- Combine and Return ---
         # Return None only if both info and history are empty/failed
         if not cleaned_info and not history_list:
              logging.warning(f"No data (info or history) could be compiled for {ticker_symbol}.")
+             _cache_put(cache_key, _NOT_FOUND)
              return None
 
-        return {"info": cleaned_info, "history": history_list}
+        payload = {"info": cleaned_info, "history": history_list}
+        _cache_put(cache_key, payload)
+        return payload
 
     except YFDataException as e:
-        # Handle yfinance specific data errors (like 404s)
+        # Handle yfinance specific data errors (like 404s); cache the outcome
+        # so repeated requests for the same bad ticker skip the network
         logging.error(f"YFinance data exception for {ticker_symbol}: {e}", exc_info=False) # Less verbose log
+        _cache_put(cache_key, _NOT_FOUND)
         return None
     except Exception as e:
         # Catch any other unexpected errors during the main process
         logging.error(f"Unexpected error during get_stock_data for {ticker_symbol}: {e}", exc_info=True)
         return None
 
+# Responses below this size are not worth the compression round-trip
+COMPRESS_MIN_SIZE = 1024
+COMPRESS_LEVEL = 5
+
+def _orjson_response(obj):
+    """
+    Serializes a payload with orjson (Rust-backed, ~5-10x faster than the
+    stdlib encoder jsonify uses) and wraps it in a Flask Response.
+    OPT_SERIALIZE_NUMPY covers any numpy scalars that slip past cleaning,
+    and naive datetimes are emitted as UTC with a 'Z' suffix. Large bodies
+    are gzipped when the client accepts it -- the repeated JSON keys across
+    ~252 history rows compress roughly 5-10x.
+    """
+    payload = orjson.dumps(
+        obj,
+        option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC | orjson.OPT_UTC_Z,
+    )
+    response = Response(payload, mimetype='application/json')
+    if len(payload) >= COMPRESS_MIN_SIZE and 'gzip' in request.accept_encodings:
+        response.set_data(gzip.compress(payload, compresslevel=COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers['Vary'] = 'Accept-Encoding'
+    return response
+
+MSGPACK_MIMETYPE = 'application/x-msgpack'
+
+def _msgpack_response(obj):
+    """
+    Serializes a payload as MessagePack for clients that ask for it via
+    Accept: application/x-msgpack. Binary encoding of the numeric-heavy
+    history cuts both encoding CPU and wire bytes versus JSON.
+    """
+    payload = ormsgpack.packb(
+        obj,
+        option=ormsgpack.OPT_SERIALIZE_NUMPY | ormsgpack.OPT_NAIVE_UTC,
+    )
+    return Response(payload, mimetype=MSGPACK_MIMETYPE)
+
 # --- API Route ---
 @app.route('/api/stockdata/<ticker_symbol>', methods=['GET'])
 def stock_data_endpoint(ticker_symbol):
@@ -212,13 +481,26 @@ def stock_data_endpoint(ticker_symbol):
         logging.warning("API call received without a valid ticker symbol.")
         return jsonify({"error": "Ticker symbol is required"}), 400
 
+    # Optional override of the default info allowlist, e.g. ?fields=symbol,marketCap
+    fields_param = request.args.get('fields')
+    fields = None
+    if fields_param:
+        fields = frozenset(f.strip() for f in fields_param.split(',') if f.strip()) or None
+
     logging.info(f"API request received for ticker: {sanitized_ticker}")
-    data = get_stock_data(sanitized_ticker)
+    data = get_stock_data(sanitized_ticker, fields)
 
     if data:
         try:
-            # Attempt to jsonify the cleaned data
-            response = jsonify(data)
+            # Attempt to serialize the cleaned data, honoring msgpack only if
+            # the client explicitly prefers it and the encoder is installed.
+            # JSON is listed first so wildcard Accept headers (*/*, the browser
+            # default) resolve to JSON rather than msgpack.
+            preferred = request.accept_mimetypes.best_match(
+                ['application/json', MSGPACK_MIMETYPE])
+            if ormsgpack is not None and preferred == MSGPACK_MIMETYPE:
+                return _msgpack_response(data)
+            response = _orjson_response(data)
             return response
         except Exception as json_error:
             # This error should be much rarer now after safe_convert
@@ -231,6 +513,60 @@ def stock_data_endpoint(ticker_symbol):
         logging.warning(f"Failed to fetch or process data for ticker: {sanitized_ticker}. Returning 404.")
         return jsonify({"error": f"No data found or error processing for ticker symbol: {sanitized_ticker}"}), 404
 
+# --- Batch API Route ---
+@app.route('/api/stockdata_batch', methods=['GET'])
+def stock_data_batch_endpoint():
+    """
+    Fetches history for several tickers in one shot, e.g.
+    /api/stockdata_batch?tickers=AAPL,MSFT,GOOG. yf.download pipelines all
+    symbols through one threaded fetch instead of N sequential round-trips.
+    """
+    tickers_param = request.args.get('tickers', '')
+    symbols = [t.strip().upper() for t in tickers_param.split(',') if t.strip()]
+    if not symbols:
+        logging.warning("Batch API call received without ticker symbols.")
+        return jsonify({"error": "tickers query parameter is required"}), 400
+
+    logging.info(f"Batch API request received for tickers: {symbols}")
+    start_str, end_str = _date_range()
+    try:
+        batch_df = yf.download(
+            tickers=symbols,
+            start=start_str,
+            end=end_str,
+            group_by='ticker',
+            threads=True,
+            progress=False,
+            session=SESSION,
+        )
+    except Exception as batch_err:
+        logging.error(f"Batch download failed for {symbols}: {batch_err}", exc_info=True)
+        return jsonify({"error": "Failed to fetch batch stock data"}), 502
+
+    results = {}
+    for symbol in symbols:
+        if isinstance(batch_df.columns, pd.MultiIndex):
+            symbol_df = batch_df[symbol] if symbol in batch_df.columns.get_level_values(0) else pd.DataFrame()
+        else:
+            # Single surviving ticker: yf.download returns a flat frame
+            symbol_df = batch_df
+        symbol_df = symbol_df.dropna(how='all')
+        if symbol_df.empty:
+            logging.warning(f"No batch history for ticker '{symbol}'.")
+            results[symbol] = {"history": []}
+        else:
+            results[symbol] = {"history": _clean_history_records(symbol_df)}
+
+    return _orjson_response(results)
+
+# --- Cache Admin Route ---
+@app.route('/api/cache/clear', methods=['POST'])
+def cache_clear_endpoint():
+    """ Clears the cached per-ticker info so the next request refetches it. """
+    _fetch_cleaned_info.cache_clear()
+    logging.info("Cleared cached ticker info.")
+    return jsonify({"status": "cleared"}), 200
+
 # --- Health Check Route ---
 @app.route('/health', methods=['GET'])
 def health_check():
@@ -238,8 +574,11 @@ def health_check():
     return jsonify({"status": "ok"}), 200
 
 # --- Run the App ---
+# In production, serve with gunicorn instead of the single-threaded Werkzeug
+# dev server so one slow yfinance call cannot block every other client. The
+# endpoint is I/O-bound (HTTPS round-trips), so threaded workers fit best:
+#   gunicorn -w 4 --threads 8 --worker-class gthread -b 0.0.0.0:$BACKEND_PORT api:app
 if __name__ == '__main__':
     port = int(BACKEND_PORT)
-    logging.info(f"Starting Flask server on host 0.0.0.0 port {port}")
-    # Set debug=False for production
-    app.run(host='0.0.0.0', port=port, debug=True)
+    logging.info(f"Starting Flask dev server on host 0.0.0.0 port {port}")
+    app.run(host='0.0.0.0', port=port, debug=False)